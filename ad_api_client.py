@@ -6,30 +6,28 @@
 """
 from __future__ import annotations
 
-import json
 import os
-import urllib.error
-import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
+import urllib3
 
-def _prepare_request(url: str, method: str, payload: Optional[Dict[str, Any]] = None) -> urllib.request.Request:
-    data = None
-    headers = {"Accept": "application/json"}
-    if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-        headers["Content-Type"] = "application/json"
-    return urllib.request.Request(url, data=data, headers=headers, method=method)
+_GET_HEADERS = {"Accept": "application/json"}
+_POST_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
 
 
-def _handle_response(response: urllib.request.HTTPResponse) -> Dict[str, Any]:
-    body = response.read().decode("utf-8") if response.length is None or response.length > 0 else "{}"
+# Общий пул потоков для пакетных запросов; urllib3.PoolManager
+# потокобезопасен, maxsize пула соединений совпадает с числом воркеров.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+
+def _parse_body(data: bytes) -> Dict[str, Any]:
     try:
-        return json.loads(body) if body else {}
-    except json.JSONDecodeError:
-        return {"raw": body}
+        return orjson.loads(data) if data else {}
+    except orjson.JSONDecodeError:
+        return {"raw": data.decode("utf-8", errors="replace")}
 
 
 @dataclass
@@ -39,35 +37,46 @@ class ApiResult:
 
 
 class AdApiClient:
-    """Клиент для взаимодействия с сервисом объявлений."""
+    """Клиент для взаимодействия с сервисом объявлений.
+
+    Методы эндпоинтов собираются в ``__init__`` как специализированные
+    замыкания: HTTP-метод, шаблон URL и заголовки фиксируются один раз,
+    без общей диспетчеризации на каждый вызов.
+    """
 
     def __init__(self, base_url: Optional[str] = None) -> None:
         self.base_url = (base_url or os.environ.get("SERVICE_BASE_URL") or "http://localhost:8000").rstrip("/")
-
-    def _request(self, path: str, method: str, payload: Optional[Dict[str, Any]] = None) -> ApiResult:
-        url = urllib.parse.urljoin(self.base_url + "/", path.lstrip("/"))
-        req = _prepare_request(url, method, payload)
-        try:
-            with urllib.request.urlopen(req) as resp:  # type: ignore[arg-type]
-                return ApiResult(status=resp.status, body=_handle_response(resp))
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8") if exc.fp else ""
-            parsed = {}
-            try:
-                parsed = json.loads(body)
-            except json.JSONDecodeError:
-                parsed = {"raw": body}
-            return ApiResult(status=exc.code, body=parsed)
-
-    def create_item(self, payload: Dict[str, Any]) -> ApiResult:
-        return self._request("/api/1/item", "POST", payload)
-
-    def get_item(self, item_id: str) -> ApiResult:
-        return self._request(f"/api/1/item/{item_id}", "GET")
-
-    def list_items(self, seller_id: Any) -> ApiResult:
-        query = urllib.parse.urlencode({"sellerId": seller_id})
-        return self._request(f"/api/1/items?{query}", "GET")
-
-    def get_statistics(self, item_id: str) -> ApiResult:
-        return self._request(f"/api/1/statistics/{item_id}", "GET")
+        # base_url уже нормализован (без завершающего "/"), поэтому URL
+        # собирается простой конкатенацией без urljoin.
+        self._root = self.base_url
+        # Один пул с keep-alive: соединение переиспользуется между запросами.
+        self._pool = urllib3.PoolManager(num_pools=1, maxsize=8, headers=_GET_HEADERS)
+
+        request = self._pool.request
+        root = self._root
+        dumps = orjson.dumps
+
+        def create_item(payload: Dict[str, Any], _url: str = root + "/api/1/item") -> ApiResult:
+            resp = request("POST", _url, body=dumps(payload), headers=_POST_HEADERS)
+            return ApiResult(status=resp.status, body=_parse_body(resp.data))
+
+        def create_items(payloads: List[Dict[str, Any]]) -> List[ApiResult]:
+            return list(_EXECUTOR.map(create_item, payloads))
+
+        def get_item(item_id: str) -> ApiResult:
+            resp = request("GET", f"{root}/api/1/item/{item_id}", headers=_GET_HEADERS)
+            return ApiResult(status=resp.status, body=_parse_body(resp.data))
+
+        def list_items(seller_id: Any) -> ApiResult:
+            resp = request("GET", f"{root}/api/1/items?sellerId={seller_id}", headers=_GET_HEADERS)
+            return ApiResult(status=resp.status, body=_parse_body(resp.data))
+
+        def get_statistics(item_id: str) -> ApiResult:
+            resp = request("GET", f"{root}/api/1/statistics/{item_id}", headers=_GET_HEADERS)
+            return ApiResult(status=resp.status, body=_parse_body(resp.data))
+
+        self.create_item = create_item
+        self.create_items = create_items
+        self.get_item = get_item
+        self.list_items = list_items
+        self.get_statistics = get_statistics
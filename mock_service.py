@@ -1,16 +1,35 @@
 """Примитивный HTTP-мок, эмулирующий сервис объявлений."""
 from __future__ import annotations
 
-import json
+import asyncio
 import threading
-from dataclasses import dataclass, field, asdict
+import time
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any, Dict, List, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
+import msgspec
+import orjson
 
-@dataclass
+_STATUS_LINES = {
+    200: b"HTTP/1.1 200 OK\r\n",
+    201: b"HTTP/1.1 201 Created\r\n",
+    400: b"HTTP/1.1 400 Bad Request\r\n",
+    404: b"HTTP/1.1 404 Not Found\r\n",
+}
+
+# Ответы с фиксированным телом кодируются один раз при загрузке модуля.
+_ERR_NOT_FOUND = orjson.dumps({"error": "Not Found"})
+_ERR_ITEM_NOT_FOUND = orjson.dumps({"error": "item not found"})
+_ERR_STATS_NOT_FOUND = orjson.dumps({"error": "stats not found"})
+_ERR_SELLER_REQUIRED = orjson.dumps({"error": "sellerId is required"})
+_ERR_SELLER_NOT_INT = orjson.dumps({"error": "sellerId must be integer"})
+_ERR_SELLER_RANGE = orjson.dumps({"error": "sellerId must be in range 111111-999999"})
+
+
+@dataclass(slots=True)
 class Item:
     id: str
     title: str
@@ -20,7 +39,7 @@ class Item:
     createdAt: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
     itemId: str
     views: int = 0
@@ -28,160 +47,235 @@ class Stats:
     favorites: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Storage:
-    items: Dict[str, Item] = field(default_factory=dict)
-    stats: Dict[str, Stats] = field(default_factory=dict)
-    counter: int = 0
-
-    def next_id(self) -> str:
-        self.counter += 1
-        return str(self.counter)
-
-
-class Handler(BaseHTTPRequestHandler):
-    server_version = "MockAdServer/1.0"
-
-    def _json_response(self, status: int, payload: Dict[str, Any]) -> None:
-        body = json.dumps(payload).encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
-
-    def _read_json(self) -> Optional[Dict[str, Any]]:
-        length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length) if length else b""
-        if not raw:
-            return None
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            return None
+    # Параллельные массивы: позиция i описывает i-е созданное объявление.
+    # Готовые dict-представления считаются один раз при вставке, так как
+    # объекты неизменяемы после создания.
+    ids: List[str] = field(default_factory=list)
+    seller_ids: array = field(default_factory=lambda: array("i"))
+    # Момент создания в наносекундах: целочисленный ключ сортировки
+    # вместо сравнения ISO-строк, если порядок вставки перестанет
+    # совпадать с порядком createdAt.
+    created_ns: array = field(default_factory=lambda: array("q"))
+    items: List[Item] = field(default_factory=list)
+    dicts: List[Dict[str, Any]] = field(default_factory=list)
+    # Сериализованные конверты ответов: GET отдаёт готовые байты без
+    # повторного кодирования.
+    jsons: List[bytes] = field(default_factory=list)
+    stats_jsons: List[bytes] = field(default_factory=list)
+    idx_by_id: Dict[str, int] = field(default_factory=dict)
+    # Счётчики статистики одним непрерывным буфером: тройка
+    # (views, contacts, favorites) для объявления i лежит в
+    # stats_arr[3*i : 3*i+3]. При изменении счётчиков нужно
+    # обновлять и кешированный конверт в stats_jsons.
+    stats_arr: array = field(default_factory=lambda: array("q"))
+    # Индекс продавец -> id объявлений в порядке создания.
+    by_seller: Dict[int, List[str]] = field(default_factory=dict)
 
-    @property
-    def storage(self) -> Storage:
-        return self.server.storage  # type: ignore[attr-defined]
-
-    def do_POST(self) -> None:  # noqa: N802
-        if self.path.rstrip("/") == "/api/1/item":
-            self._handle_create_item()
-        else:
-            self.send_error(404, "Not Found")
-
-    def do_GET(self) -> None:  # noqa: N802
-        parsed = urlparse(self.path)
-        if parsed.path.startswith("/api/1/item/"):
-            item_id = parsed.path.split("/")[-1]
-            self._handle_get_item(item_id)
-        elif parsed.path.startswith("/api/1/items"):
-            params = parse_qs(parsed.query)
-            seller_ids = params.get("sellerId")
-            seller = seller_ids[0] if seller_ids else None
-            self._handle_list_items(seller)
-        elif parsed.path.startswith("/api/1/statistics/"):
-            item_id = parsed.path.split("/")[-1]
-            self._handle_stats(item_id)
-        else:
-            self.send_error(404, "Not Found")
-
-    def _validate_item(self, payload: Optional[Dict[str, Any]]) -> List[str]:
-        errors: List[str] = []
-        if payload is None:
-            return ["body must be JSON"]
-        for field_name in ["title", "description", "price", "sellerId"]:
-            if field_name not in payload:
-                errors.append(f"missing field: {field_name}")
-        title = payload.get("title", "")
-        if not isinstance(title, str) or not title:
-            errors.append("title must be non-empty string")
-        if isinstance(title, str) and len(title) > 255:
-            errors.append("title too long")
-        description = payload.get("description", "")
-        if not isinstance(description, str) or not description:
-            errors.append("description must be non-empty string")
-        if isinstance(description, str) and len(description) > 2000:
-            errors.append("description too long")
-        price = payload.get("price")
-        if not isinstance(price, int) or price <= 0:
-            errors.append("price must be positive integer")
-        seller_id = payload.get("sellerId")
-        if not isinstance(seller_id, int) or not (111111 <= seller_id <= 999999):
-            errors.append("sellerId must be int in range 111111-999999")
-        return errors
-
-    def _handle_create_item(self) -> None:
-        payload = self._read_json()
-        errors = self._validate_item(payload)
-        if errors:
-            self._json_response(400, {"errors": errors})
-            return
-        assert payload is not None
-        item_id = self.storage.next_id()
-        item = Item(
-            id=item_id,
-            title=payload["title"],
-            description=payload["description"],
-            price=payload["price"],
-            sellerId=payload["sellerId"],
-            createdAt=datetime.now(timezone.utc).isoformat(),
-        )
-        self.storage.items[item_id] = item
-        self.storage.stats[item_id] = Stats(itemId=item_id)
-        self._json_response(201, {"item": asdict(item)})
-
-    def _handle_get_item(self, item_id: str) -> None:
-        item = self.storage.items.get(item_id)
-        if not item:
-            self._json_response(404, {"error": "item not found"})
-            return
-        self._json_response(200, {"item": asdict(item)})
-
-    def _handle_list_items(self, seller: Optional[str]) -> None:
-        try:
-            seller_id = int(seller) if seller is not None else None
-        except ValueError:
-            self._json_response(400, {"error": "sellerId must be integer"})
-            return
-        if seller_id is None:
-            self._json_response(400, {"error": "sellerId is required"})
-            return
-        if not (111111 <= seller_id <= 999999):
-            self._json_response(400, {"error": "sellerId must be in range 111111-999999"})
-            return
-        items = [asdict(item) for item in self.storage.items.values() if item.sellerId == seller_id]
-        items.sort(key=lambda x: x["createdAt"])
-        self._json_response(200, {"items": items})
 
-    def _handle_stats(self, item_id: str) -> None:
-        stats = self.storage.stats.get(item_id)
-        if not stats:
-            self._json_response(404, {"error": "stats not found"})
-            return
-        self._json_response(200, {"statistics": asdict(stats)})
+class ItemIn(msgspec.Struct):
+    """Входной payload создания объявления: декодирование и валидация
+    выполняются одним проходом на стороне C через msgspec."""
+
+    title: Annotated[str, msgspec.Meta(min_length=1, max_length=255)]
+    description: Annotated[str, msgspec.Meta(min_length=1, max_length=2000)]
+    price: Annotated[int, msgspec.Meta(gt=0)]
+    sellerId: Annotated[int, msgspec.Meta(ge=111111, le=999999)]
 
-    def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
-        return
+
+_ITEM_DECODER = msgspec.json.Decoder(ItemIn)
 
 
 class MockAdServer:
-    """Контекстный менеджер для запуска мок-сервера в фоновом потоке."""
+    """Контекстный менеджер для запуска асинхронного мок-сервера в фоновом потоке."""
 
     def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
-        self.server = ThreadingHTTPServer((host, port), Handler)
-        self.server.storage = Storage()  # type: ignore[attr-defined]
-        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.host = host
+        self._requested_port = port
+        self._port: Optional[int] = None
+        self.storage = Storage()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._started = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        # Диспетчеризация по точному пути; маршруты с id обрабатываются
+        # по префиксу в _dispatch.
+        self._routes = {
+            ("POST", "/api/1/item"): self._handle_create_item,
+            ("GET", "/api/1/items"): self._handle_list_items,
+        }
 
     @property
     def base_url(self) -> str:
-        host, port = self.server.server_address
-        return f"http://{host}:{port}"
+        return f"http://{self.host}:{self._port}"
+
+    # -- жизненный цикл ------------------------------------------------
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start())
+        self._started.set()
+        self._loop.run_forever()
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.run_until_complete(self._server.wait_closed())
+        self._loop.close()
+
+    async def _start(self) -> None:
+        self._counter_lock = asyncio.Lock()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self._requested_port)
+        self._port = self._server.sockets[0].getsockname()[1]
 
     def __enter__(self) -> "MockAdServer":
         self.thread.start()
+        self._started.wait(timeout=5)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
-        self.server.shutdown()
+        def _stop() -> None:
+            self._server.close()
+            self._loop.stop()
+
+        self._loop.call_soon_threadsafe(_stop)
         self.thread.join(timeout=2)
+
+    # -- HTTP-слой -----------------------------------------------------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, _version = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                # Ограничиваем чтение тела сверху: мок рассчитан на
+                # небольшие payload'ы.
+                try:
+                    length = min(int(headers["content-length"]), 1 << 20)
+                except (KeyError, ValueError):
+                    length = 0
+                raw = await reader.readexactly(length) if length else b""
+                status, payload = await self._dispatch(method, target, raw)
+                body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+                writer.write(
+                    _STATUS_LINES[status]
+                    + b"Content-Type: application/json\r\n"
+                    + b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n\r\n"
+                    + body
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, target: str, raw: bytes) -> Tuple[int, Any]:
+        parsed = urlparse(target)
+        handler = self._routes.get((method, parsed.path.rstrip("/")))
+        if handler is not None:
+            return await handler(parsed.query, raw)
+        if method == "GET" and parsed.path.startswith("/api/1/item/"):
+            return self._handle_get_item(parsed.path.rsplit("/", 1)[-1])
+        if method == "GET" and parsed.path.startswith("/api/1/statistics/"):
+            return self._handle_stats(parsed.path.rsplit("/", 1)[-1])
+        return 404, _ERR_NOT_FOUND
+
+    # -- обработчики ---------------------------------------------------
+
+    async def _handle_create_item(self, query: str, raw: bytes) -> Tuple[int, Any]:
+        try:
+            payload = _ITEM_DECODER.decode(raw)
+        except msgspec.ValidationError as exc:
+            return 400, {"errors": [str(exc)]}
+        except msgspec.DecodeError:
+            return 400, {"errors": ["body must be JSON"]}
+        storage = self.storage
+        async with self._counter_lock:
+            idx = len(storage.ids)
+            item_id = str(idx + 1)
+            created_ns = time.time_ns()
+            item = Item(
+                id=item_id,
+                title=payload.title,
+                description=payload.description,
+                price=payload.price,
+                sellerId=payload.sellerId,
+                createdAt=datetime.fromtimestamp(created_ns / 1e9, timezone.utc).isoformat(),
+            )
+            item_dict = {
+                "id": item.id,
+                "title": item.title,
+                "description": item.description,
+                "price": item.price,
+                "sellerId": item.sellerId,
+                "createdAt": item.createdAt,
+            }
+            envelope = orjson.dumps({"item": item_dict})
+            storage.ids.append(item_id)
+            storage.seller_ids.append(item.sellerId)
+            storage.created_ns.append(created_ns)
+            storage.items.append(item)
+            storage.dicts.append(item_dict)
+            storage.jsons.append(envelope)
+            storage.idx_by_id[item_id] = idx
+            storage.by_seller.setdefault(item.sellerId, []).append(item_id)
+            storage.stats_arr.extend((0, 0, 0))
+            base = 3 * idx
+            arr = storage.stats_arr
+            storage.stats_jsons.append(orjson.dumps({
+                "statistics": {
+                    "itemId": item_id,
+                    "views": arr[base],
+                    "contacts": arr[base + 1],
+                    "favorites": arr[base + 2],
+                },
+            }))
+        return 201, envelope
+
+    def _handle_get_item(self, item_id: str) -> Tuple[int, Any]:
+        idx = self.storage.idx_by_id.get(item_id)
+        if idx is None:
+            return 404, _ERR_ITEM_NOT_FOUND
+        return 200, self.storage.jsons[idx]
+
+    async def _handle_list_items(self, query: str, raw: bytes) -> Tuple[int, Dict[str, Any]]:
+        # Эндпоинт принимает единственный параметр, поэтому разбираем
+        # строку запроса напрямую, без parse_qs.
+        if not query.startswith("sellerId="):
+            return 400, _ERR_SELLER_REQUIRED
+        try:
+            seller_id = int(query[9:].split("&", 1)[0])
+        except ValueError:
+            return 400, _ERR_SELLER_NOT_INT
+        if not (111111 <= seller_id <= 999999):
+            return 400, _ERR_SELLER_RANGE
+        # Индекс хранит id в порядке создания, поэтому сортировка
+        # по createdAt не нужна.
+        storage = self.storage
+        ids = storage.by_seller.get(seller_id, [])
+        dicts = storage.dicts
+        idx_by_id = storage.idx_by_id
+        items = [dicts[idx_by_id[item_id]] for item_id in ids]
+        return 200, {"items": items}
+
+    def _handle_stats(self, item_id: str) -> Tuple[int, Any]:
+        idx = self.storage.idx_by_id.get(item_id)
+        if idx is None:
+            return 404, _ERR_STATS_NOT_FOUND
+        return 200, self.storage.stats_jsons[idx]
@@ -2,8 +2,9 @@ import os
 import random
 import string
 import sys
+import types
 from pathlib import Path
-from typing import Dict
+from typing import Mapping
 
 import pytest
 
@@ -24,23 +25,31 @@ def base_url() -> str:
         yield server.base_url
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client(base_url: str) -> AdApiClient:
+    # Один клиент на сессию: тёплый пул соединений переживает все тесты.
     return AdApiClient(base_url)
 
 
-@pytest.fixture()
-def sample_payload() -> Dict[str, object]:
-    return {
+@pytest.fixture(scope="session")
+def sample_payload() -> Mapping[str, object]:
+    # Read-only прокси: тесты обязаны копировать через dict(sample_payload),
+    # случайная мутация общего payload упадёт сразу.
+    return types.MappingProxyType({
         "title": "Велосипед",
         "description": "Горный, хорошее состояние",
         "price": 15000,
         "sellerId": random.randint(111111, 999999),
-    }
+    })
+
+
+# Таблица на 256 байт: каждый случайный байт отображается в букву,
+# поэтому генерация строки — один вызов os.urandom + translate.
+_ALPHA = (string.ascii_letters * 5).encode()[:256]
 
 
 def random_string(length: int) -> str:
-    return "".join(random.choices(string.ascii_letters, k=length))
+    return os.urandom(length).translate(_ALPHA).decode("ascii")
 
 
 @pytest.fixture()
@@ -15,13 +15,13 @@ def assert_item_body(body: dict, payload: dict) -> None:
 
 
 def test_create_item_success(client: AdApiClient, sample_payload: dict):
-    result = client.create_item(sample_payload)
+    result = client.create_item(dict(sample_payload))
     assert result.status in (200, 201)
     assert_item_body(result.body, sample_payload)
 
 
 def test_get_existing_item(client: AdApiClient, sample_payload: dict):
-    created = client.create_item(sample_payload)
+    created = client.create_item(dict(sample_payload))
     item_id = created.body["item"]["id"]
 
     fetched = client.get_item(item_id)
@@ -31,14 +31,15 @@ def test_get_existing_item(client: AdApiClient, sample_payload: dict):
 
 
 def test_list_items_by_seller(client: AdApiClient, sample_payload: dict):
+    # Свой sellerId, чтобы не пересекаться с объявлениями других тестов,
+    # созданными с общим session-scoped payload.
     payload_a1 = dict(sample_payload)
-    payload_a2 = dict(sample_payload)
-    payload_b = dict(sample_payload)
+    payload_a1["sellerId"] = sample_payload["sellerId"] + 1
+    payload_a2 = dict(payload_a1)
+    payload_b = dict(payload_a1)
     payload_b["sellerId"] = payload_a1["sellerId"] + 1
 
-    created_a1 = client.create_item(payload_a1)
-    created_a2 = client.create_item(payload_a2)
-    client.create_item(payload_b)
+    created_a1, created_a2, _ = client.create_items([payload_a1, payload_a2, payload_b])
 
     response = client.list_items(payload_a1["sellerId"])
     assert response.status == 200
@@ -51,7 +52,7 @@ def test_list_items_by_seller(client: AdApiClient, sample_payload: dict):
 
 
 def test_statistics_existing_item(client: AdApiClient, sample_payload: dict):
-    created = client.create_item(sample_payload)
+    created = client.create_item(dict(sample_payload))
     item_id = created.body["item"]["id"]
 
     stats = client.get_statistics(item_id)